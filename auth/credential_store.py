@@ -5,21 +5,199 @@ This module provides a standardized interface for credential storage and retriev
 On macOS (the only supported platform), credentials are stored in the system Keychain.
 """
 
+import asyncio
+import atexit
+import importlib.util
 import json
 import logging
 import os
 import platform
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, List
-from datetime import datetime
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
+from google.auth import _helpers as google_auth_helpers
 from google.oauth2.credentials import Credentials
 
 logger = logging.getLogger(__name__)
 
+# Cached credentials are served until this many seconds before they expire,
+# after which the backing store is consulted again. google-auth already treats
+# credentials as expired REFRESH_THRESHOLD before their expiry, so the margin
+# extends past that to never hand out credentials that need a refresh.
+_CACHE_EXPIRY_MARGIN_SECONDS = (
+    google_auth_helpers.REFRESH_THRESHOLD.total_seconds() + 60
+)
+# How long to cache credentials that carry no expiry.
+_CACHE_DEFAULT_TTL_SECONDS = 300
+# Delay before the keychain writer flushes, letting bursts of writes coalesce.
+_WRITE_BEHIND_DELAY_SECONDS = 0.1
+# Backoff between attempts when the keychain writer fails to flush.
+_WRITE_RETRY_INITIAL_DELAY_SECONDS = 1.0
+_WRITE_RETRY_MAX_DELAY_SECONDS = 60.0
+# Temporary credential files left by an interrupted write are removed once
+# they are this old, as no write in progress takes that long.
+_STALE_TEMP_FILE_SECONDS = 60
+# Compact separators keep stored credential payloads small.
+_JSON_SEPARATORS = (",", ":")
+
+
+def _json_dumps(obj) -> str:
+    """Serialize an object to compact JSON text."""
+    return json.dumps(obj, separators=_JSON_SEPARATORS)
+
+
+_json_loads = json.loads
+
+
+# Guards creation of the per-user locks held by every credential store
+_user_locks_guard = threading.Lock()
+
+
+# Stored expiries are whole seconds since this naive UTC epoch
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching Credentials.expiry."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _parse_google_expiry(value: str) -> datetime:
+    """
+    Parse a legacy ISO-8601 expiry timestamp into a timezone-naive datetime.
+
+    Older versions wrote expiries with datetime.isoformat() as
+    YYYY-MM-DDTHH:MM:SS[.ffffff][+HH:MM], so the fields are sliced out directly.
+    Any UTC offset is ignored, as the Google auth library expects naive
+    datetimes. Other layouts fall back to datetime.fromisoformat().
+
+    Raises:
+        ValueError: If the value is not a valid ISO-8601 timestamp
+        TypeError: If the value is not a string
+    """
+    fraction = value[20:26] if value[19:20] == "." else ""
+    if (
+        len(value) >= 19
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] in "T "
+        and value[13] == ":"
+        and value[16] == ":"
+        and (value[19:20] != "." or len(fraction) == 6)
+        and not value[26:27].isdigit()
+    ):
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                int(fraction) if fraction else 0,
+            )
+        except ValueError:
+            pass
+
+    expiry = datetime.fromisoformat(value)
+    if expiry.tzinfo is not None:
+        expiry = expiry.replace(tzinfo=None)
+    return expiry
+
+
+def _credentials_from_dict(creds_data: dict, user_email: str) -> Credentials:
+    """Build a Credentials object from its stored dict form."""
+    get = creds_data.get
+    expiry = None
+    expiry_epoch = get("expiry_epoch")
+    if expiry_epoch is not None:
+        try:
+            expiry = _EPOCH + timedelta(seconds=expiry_epoch)
+        except (OverflowError, TypeError) as e:
+            logger.warning(f"Could not parse expiry time for {user_email}: {e}")
+    elif get("expiry"):
+        # Credentials stored before expiry_epoch was introduced
+        try:
+            expiry = _parse_google_expiry(get("expiry"))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Could not parse expiry time for {user_email}: {e}")
+
+    return Credentials(
+        token=get("token"),
+        refresh_token=get("refresh_token"),
+        token_uri=get("token_uri"),
+        client_id=get("client_id"),
+        client_secret=get("client_secret"),
+        scopes=get("scopes"),
+        expiry=expiry,
+    )
+
+
+def _copy_credentials(credentials: Credentials) -> Credentials:
+    """
+    Make an independent copy of a Credentials object.
+
+    Callers refresh credentials in place, so cached credentials are copied
+    rather than shared between callers.
+    """
+    scopes = credentials.scopes
+    return Credentials(
+        token=credentials.token,
+        refresh_token=credentials.refresh_token,
+        token_uri=credentials.token_uri,
+        client_id=credentials.client_id,
+        client_secret=credentials.client_secret,
+        scopes=list(scopes) if scopes is not None else None,
+        expiry=credentials.expiry,
+    )
+
+
+def _credentials_to_dict(credentials: Credentials) -> dict:
+    """Convert a Credentials object to the dict form that gets stored."""
+    expiry = credentials.expiry
+    if expiry is not None:
+        if expiry.tzinfo is not None:
+            expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
+        # Both fields hold whole seconds, so credentials read back from either
+        # serialize to exactly the stored dict
+        expiry = expiry.replace(microsecond=0)
+    return {
+        "token": credentials.token,
+        "refresh_token": credentials.refresh_token,
+        "token_uri": credentials.token_uri,
+        "client_id": credentials.client_id,
+        "client_secret": credentials.client_secret,
+        "scopes": credentials.scopes,
+        # Kept for older versions, which only read the ISO-8601 form
+        "expiry": expiry.isoformat() if expiry else None,
+        # Seconds since the Unix epoch; expiry is naive UTC, so compute the
+        # offset directly rather than via timestamp(), which assumes local
+        "expiry_epoch": (expiry - _EPOCH) // _ONE_SECOND if expiry else None,
+    }
+
+
+def _file_version(st: os.stat_result) -> Tuple[int, int, int]:
+    """Identify a version of a credential file from its stat result."""
+    # Writes replace the file, so the inode changes even where the
+    # filesystem's mtime resolution is too coarse to tell writes apart
+    return (st.st_mtime_ns, st.st_ino, st.st_size)
+
 
 class CredentialStore(ABC):
     """Abstract base class for credential storage."""
 
+    __slots__ = ("_cache", "_user_locks")
+
+    def __init__(self):
+        """Initialize the state shared by the caching helpers."""
+        self._cache: Dict[str, Tuple[Credentials, float]] = {}
+        self._user_locks: Dict[str, threading.Lock] = {}
+
     @abstractmethod
     def get_credential(self, user_email: str) -> Optional[Credentials]:
         """
@@ -60,20 +238,127 @@ class CredentialStore(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_credentials_bulk(self, user_emails: List[str]) -> Dict[str, Credentials]:
+        """
+        Get credentials for several users at once.
+
+        Args:
+            user_emails: User email addresses to look up
+
+        Returns:
+            Dict mapping each email with stored credentials to its Credentials
+            object. Emails without stored credentials are omitted.
+        """
+        pass
+
     @abstractmethod
     def list_users(self) -> List[str]:
         """
         List all users with stored credentials.
 
         Returns:
-            List of user email addresses
+            List of user email addresses, in no particular order
         """
         pass
 
+    def list_users_sorted(self) -> List[str]:
+        """
+        List all users with stored credentials, sorted by email.
+
+        Returns:
+            Sorted list of user email addresses
+        """
+        users = self.list_users()
+        users.sort()
+        return users
+
+    async def aget_credential(self, user_email: str) -> Optional[Credentials]:
+        """
+        Async variant of get_credential, run in a worker thread.
+
+        Args:
+            user_email: User's email address
+
+        Returns:
+            Google Credentials object or None if not found
+        """
+        return await asyncio.to_thread(self.get_credential, user_email)
+
+    async def astore_credential(
+        self, user_email: str, credentials: Credentials
+    ) -> bool:
+        """
+        Async variant of store_credential, run in a worker thread.
+
+        Args:
+            user_email: User's email address
+            credentials: Google Credentials object to store
+
+        Returns:
+            True if successfully stored, False otherwise
+        """
+        return await asyncio.to_thread(self.store_credential, user_email, credentials)
+
+    def _get_user_lock(self, user_email: str) -> threading.Lock:
+        """
+        Get the lock serializing store access for one user.
+
+        Readers only take it on a cache miss, so concurrent lookups for the
+        same user share a single read of the backing store.
+        """
+        lock = self._user_locks.get(user_email)
+        if lock is None:
+            with _user_locks_guard:
+                lock = self._user_locks.setdefault(user_email, threading.Lock())
+        return lock
+
+    @contextmanager
+    def _lock_users(self, user_emails: Iterable[str]) -> Iterator[None]:
+        """Hold the locks for several users, acquired in a consistent order."""
+        with ExitStack() as stack:
+            for user_email in sorted(set(user_emails)):
+                stack.enter_context(self._get_user_lock(user_email))
+            yield
+
+    def _get_cached(self, user_email: str) -> Optional[Credentials]:
+        """Return a copy of cached credentials for a user if they are still fresh."""
+        entry = self._cache.get(user_email)
+        if entry is not None and time.monotonic() < entry[1]:
+            return _copy_credentials(entry[0])
+        return None
+
+    def _set_cached(self, user_email: str, credentials: Credentials) -> None:
+        """
+        Cache credentials until shortly before they expire.
+
+        A copy is cached, so the caller keeps sole ownership of credentials.
+        """
+        if credentials.expiry is not None:
+            ttl = (
+                credentials.expiry - _utcnow()
+            ).total_seconds() - _CACHE_EXPIRY_MARGIN_SECONDS
+        else:
+            ttl = _CACHE_DEFAULT_TTL_SECONDS
+
+        if ttl > 0:
+            self._cache[user_email] = (
+                _copy_credentials(credentials),
+                time.monotonic() + ttl,
+            )
+        else:
+            self._cache.pop(user_email, None)
+
+    def _invalidate_cached(self, user_email: str) -> None:
+        """Drop any cached credentials for a user."""
+        self._cache.pop(user_email, None)
+
 
 class LocalDirectoryCredentialStore(CredentialStore):
     """Credential store that uses local JSON files for storage."""
 
+    __slots__ = ("base_dir", "_last_written", "_file_cache")
+
     def __init__(self, base_dir: Optional[str] = None):
         """
         Initialize the local JSON credential store.
@@ -96,121 +381,250 @@ class LocalDirectoryCredentialStore(CredentialStore):
                 else:
                     base_dir = os.path.join(os.getcwd(), ".credentials")
 
+        super().__init__()
         self.base_dir = base_dir
+        # Credential data last read from or written to each user's file
+        self._last_written: Dict[str, dict] = {}
+        # Parsed credentials keyed by the file version they were loaded from
+        self._file_cache: Dict[str, Tuple[Tuple[int, int, int], Credentials]] = {}
+
+        # Create the directory up front so individual operations don't need to
+        # check for it.
+        if not os.path.isdir(base_dir):
+            try:
+                os.makedirs(base_dir, exist_ok=True)
+                logger.info(f"Created credentials directory: {base_dir}")
+            except OSError as e:
+                logger.error(f"Error creating credentials directory {base_dir}: {e}")
+
+        self._remove_stale_temp_files()
         logger.info(f"LocalJsonCredentialStore initialized with base_dir: {base_dir}")
 
+    def _remove_stale_temp_files(self) -> None:
+        """Remove temporary files left behind by interrupted writes."""
+        cutoff = time.time() - _STALE_TEMP_FILE_SECONDS
+        try:
+            with os.scandir(self.base_dir) as entries:
+                for entry in entries:
+                    # Current temp files end in .tmp; older versions appended
+                    # .tmp.<pid> to the credential file name
+                    name = entry.name
+                    if not (name.endswith(".tmp") or ".json.tmp." in name):
+                        continue
+                    try:
+                        if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                            os.remove(entry.path)
+                            logger.info(f"Removed stale temporary file {entry.path}")
+                    except OSError as e:
+                        logger.debug("Could not remove %s: %s", entry.path, e)
+        except OSError as e:
+            logger.debug("Could not scan %s for temporary files: %s", self.base_dir, e)
+
     def _get_credential_path(self, user_email: str) -> str:
         """Get the file path for a user's credentials."""
-        if not os.path.exists(self.base_dir):
-            os.makedirs(self.base_dir)
-            logger.info(f"Created credentials directory: {self.base_dir}")
         return os.path.join(self.base_dir, f"{user_email}.json")
 
     def get_credential(self, user_email: str) -> Optional[Credentials]:
         """Get credentials from local JSON file."""
-        creds_path = self._get_credential_path(user_email)
+        cached = self._get_cached(user_email)
+        if cached is not None:
+            return cached
+
+        with self._get_user_lock(user_email):
+            # Another thread may have loaded them while we waited
+            cached = self._get_cached(user_email)
+            if cached is not None:
+                return cached
+
+            return self._load_credential_file(
+                user_email, self._get_credential_path(user_email)
+            )
 
-        if not os.path.exists(creds_path):
-            logger.debug(f"No credential file found for {user_email} at {creds_path}")
-            return None
+    def _load_credential_file(
+        self, user_email: str, creds_path: str
+    ) -> Optional[Credentials]:
+        """
+        Load and cache credentials from a JSON file.
 
+        The file is only re-read and parsed if it changed since it was last
+        loaded; otherwise the previously parsed credentials are reused.
+        """
         try:
+            version = _file_version(os.stat(creds_path))
+            file_cached = self._file_cache.get(user_email)
+            if file_cached is not None and file_cached[0] == version:
+                credentials = _copy_credentials(file_cached[1])
+                self._set_cached(user_email, credentials)
+                return credentials
+
             with open(creds_path, "r") as f:
-                creds_data = json.load(f)
+                creds_data = _json_loads(f.read())
 
-            # Parse expiry if present
-            expiry = None
-            if creds_data.get("expiry"):
-                try:
-                    expiry = datetime.fromisoformat(creds_data["expiry"])
-                    # Ensure timezone-naive datetime for Google auth library compatibility
-                    if expiry.tzinfo is not None:
-                        expiry = expiry.replace(tzinfo=None)
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Could not parse expiry time for {user_email}: {e}")
-
-            credentials = Credentials(
-                token=creds_data.get("token"),
-                refresh_token=creds_data.get("refresh_token"),
-                token_uri=creds_data.get("token_uri"),
-                client_id=creds_data.get("client_id"),
-                client_secret=creds_data.get("client_secret"),
-                scopes=creds_data.get("scopes"),
-                expiry=expiry,
-            )
+            credentials = _credentials_from_dict(creds_data, user_email)
 
-            logger.debug(f"Loaded credentials for {user_email} from {creds_path}")
+            logger.debug("Loaded credentials for %s from %s", user_email, creds_path)
+            self._last_written[user_email] = creds_data
+            self._file_cache[user_email] = (version, _copy_credentials(credentials))
+            self._set_cached(user_email, credentials)
             return credentials
 
+        except FileNotFoundError:
+            logger.debug(
+                "No credential file found for %s at %s", user_email, creds_path
+            )
+            self._last_written.pop(user_email, None)
+            self._file_cache.pop(user_email, None)
+            return None
         except (IOError, json.JSONDecodeError, KeyError) as e:
             logger.error(
                 f"Error loading credentials for {user_email} from {creds_path}: {e}"
             )
             return None
 
+    def get_credentials_bulk(self, user_emails: List[str]) -> Dict[str, Credentials]:
+        """Get credentials for several users with a single directory scan."""
+        results: Dict[str, Credentials] = {}
+        pending = set()
+        get_cached = self._get_cached
+        for user_email in user_emails:
+            cached = get_cached(user_email)
+            if cached is not None:
+                results[user_email] = cached
+            else:
+                pending.add(user_email)
+
+        if not pending:
+            return results
+
+        load = self._load_credential_file
+        with self._lock_users(pending):
+            try:
+                with os.scandir(self.base_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".json"):
+                            continue
+                        user_email = entry.name[:-5]  # Remove .json extension
+                        if user_email not in pending or not entry.is_file(
+                            follow_symlinks=False
+                        ):
+                            continue
+                        credentials = get_cached(user_email) or load(
+                            user_email, entry.path
+                        )
+                        if credentials:
+                            results[user_email] = credentials
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error(f"Error scanning credential files in {self.base_dir}: {e}")
+
+        return results
+
     def store_credential(self, user_email: str, credentials: Credentials) -> bool:
         """Store credentials to local JSON file."""
-        creds_path = self._get_credential_path(user_email)
-
-        creds_data = {
-            "token": credentials.token,
-            "refresh_token": credentials.refresh_token,
-            "token_uri": credentials.token_uri,
-            "client_id": credentials.client_id,
-            "client_secret": credentials.client_secret,
-            "scopes": credentials.scopes,
-            "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
-        }
-
-        try:
-            with open(creds_path, "w") as f:
-                json.dump(creds_data, f, indent=2)
-            logger.info(f"Stored credentials for {user_email} to {creds_path}")
-            return True
-        except IOError as e:
-            logger.error(
-                f"Error storing credentials for {user_email} to {creds_path}: {e}"
-            )
-            return False
+        with self._get_user_lock(user_email):
+            creds_path = self._get_credential_path(user_email)
+
+            creds_data = _credentials_to_dict(credentials)
+            file_cached = self._file_cache.get(user_email)
+            if (
+                file_cached is not None
+                and self._last_written.get(user_email) == creds_data
+            ):
+                # Only trust the recorded data while the file on disk is still
+                # the version it was read from or written as
+                try:
+                    unchanged = _file_version(os.stat(creds_path)) == file_cached[0]
+                except OSError:
+                    unchanged = False
+                if unchanged:
+                    logger.debug(
+                        "Credentials for %s unchanged, skipping write", user_email
+                    )
+                    return True
+
+            self._invalidate_cached(user_email)
+            self._last_written.pop(user_email, None)
+            self._file_cache.pop(user_email, None)
+
+            # Write to a temporary file and rename it over the original so a crash
+            # mid-write never leaves a truncated credential file behind.
+            tmp_path = None
+            try:
+                # mkstemp creates a new file with O_EXCL and mode 0600, so it
+                # never follows a planted symlink or keeps another file's mode
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.base_dir, prefix=f".{user_email}.", suffix=".tmp"
+                )
+                with os.fdopen(fd, "w") as f:
+                    f.write(_json_dumps(creds_data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                    # Renaming keeps the inode and mtime, so this is the
+                    # version the file will have once it is in place
+                    st = os.fstat(f.fileno())
+                os.replace(tmp_path, creds_path)
+                self._last_written[user_email] = creds_data
+                self._file_cache[user_email] = (
+                    _file_version(st),
+                    _credentials_from_dict(creds_data, user_email),
+                )
+                logger.info(f"Stored credentials for {user_email} to {creds_path}")
+                return True
+            except IOError as e:
+                logger.error(
+                    f"Error storing credentials for {user_email} to {creds_path}: {e}"
+                )
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+                return False
 
     def delete_credential(self, user_email: str) -> bool:
         """Delete credential file for a user."""
-        creds_path = self._get_credential_path(user_email)
+        with self._get_user_lock(user_email):
+            self._invalidate_cached(user_email)
+            self._last_written.pop(user_email, None)
+            self._file_cache.pop(user_email, None)
+            creds_path = self._get_credential_path(user_email)
 
-        try:
-            if os.path.exists(creds_path):
+            try:
                 os.remove(creds_path)
                 logger.info(f"Deleted credentials for {user_email} from {creds_path}")
                 return True
-            else:
+            except FileNotFoundError:
                 logger.debug(
-                    f"No credential file to delete for {user_email} at {creds_path}"
+                    "No credential file to delete for %s at %s", user_email, creds_path
                 )
                 return True  # Consider it a success if file doesn't exist
-        except IOError as e:
-            logger.error(
-                f"Error deleting credentials for {user_email} from {creds_path}: {e}"
-            )
-            return False
+            except IOError as e:
+                logger.error(
+                    f"Error deleting credentials for {user_email} from {creds_path}: {e}"
+                )
+                return False
 
     def list_users(self) -> List[str]:
         """List all users with credential files."""
-        if not os.path.exists(self.base_dir):
-            return []
-
         users = []
         try:
-            for filename in os.listdir(self.base_dir):
-                if filename.endswith(".json"):
-                    user_email = filename[:-5]  # Remove .json extension
-                    users.append(user_email)
+            with os.scandir(self.base_dir) as entries:
+                for entry in entries:
+                    # is_file() uses the d_type from readdir, avoiding a stat()
+                    if entry.name.endswith(".json") and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        users.append(entry.name[:-5])  # Remove .json extension
             logger.debug(
-                f"Found {len(users)} users with credentials in {self.base_dir}"
+                "Found %d users with credentials in %s", len(users), self.base_dir
             )
+        except FileNotFoundError:
+            return []
         except OSError as e:
             logger.error(f"Error listing credential files in {self.base_dir}: {e}")
 
-        return sorted(users)
+        return users
 
 
 class KeychainCredentialStore(CredentialStore):
@@ -219,147 +633,402 @@ class KeychainCredentialStore(CredentialStore):
 
     CW-MODIFIED: Added for secure credential storage instead of plaintext JSON files.
     Credentials are stored in the system Keychain, protected by macOS security.
+
+    All users' credentials are kept in a single keychain item holding a JSON
+    map of email to credential data, so any lookup costs one keychain call.
+    Stores written by older versions (one item per user plus a registered-users
+    index) are copied into this layout the first time they are read; the legacy
+    items are kept until the user's credentials are deleted.
+
+    Refreshed tokens are written behind: store_credential records the change
+    in memory and a background thread writes it to the keychain shortly after,
+    coalescing bursts of writes and retrying failed writes with backoff.
+    Pending changes are visible to reads straight away, and are flushed at
+    interpreter exit or by calling flush(). Credentials for new users and new
+    refresh tokens are written immediately, as they cannot be recovered if lost.
     """
 
+    __slots__ = (
+        "_keyring",
+        "_all_creds",
+        "_pending",
+        "_pending_lock",
+        "_flush_lock",
+        "_flush_requested",
+        "_writer_thread",
+    )
+
     SERVICE_NAME = "hardened-google-workspace-mcp"
-    _USERS_KEY = "__registered_users__"
+    _ALL_CREDENTIALS_KEY = "__all_credentials__"
+    # Where an undecodable credentials map is kept before it is rebuilt
+    _CORRUPT_CREDENTIALS_KEY = "__all_credentials__.corrupt"
+    _USERS_KEY = "__registered_users__"  # Legacy per-user layout index
 
     def __init__(self):
         """Initialize the Keychain credential store."""
-        try:
-            import keyring
-
-            self._keyring = keyring
-        except ImportError as e:
+        # keyring is imported on first use, as loading it pulls in the
+        # Security framework; only check that it is installed here.
+        if importlib.util.find_spec("keyring") is None:
             raise RuntimeError(
                 "keyring package is required for Keychain credential storage. "
                 "Install it with: uv add keyring"
-            ) from e
+            )
 
+        super().__init__()
+        self._keyring = None
+        # Last credentials map read from or written to the keychain. It is
+        # replaced rather than mutated, so callers must not modify it.
+        self._all_creds: Optional[Dict[str, dict]] = None
+        # Changes not yet written to the keychain; None marks a deletion
+        self._pending: Dict[str, Optional[dict]] = {}
+        self._pending_lock = threading.Lock()
+        # Serializes every read, migration and write of the credentials map,
+        # so an older read can never replace _all_creds after a newer write.
+        # Reentrant because flush reads the map while holding it.
+        self._flush_lock = threading.RLock()
+        self._flush_requested = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
         logger.info(
             f"KeychainCredentialStore initialized (service: {self.SERVICE_NAME})"
         )
 
-    def _get_users_set(self) -> set:
-        """Get the set of registered users from keychain."""
+    def _get_keyring(self):
+        """Import the keyring module on first use and return it."""
+        if self._keyring is None:
+            import keyring
+
+            self._keyring = keyring
+        return self._keyring
+
+    def _read_all_credentials(self) -> Dict[str, dict]:
+        """Read the credentials map from the keychain, ignoring pending writes."""
+        with self._flush_lock:
+            all_json = self._get_keyring().get_password(
+                self.SERVICE_NAME, self._ALL_CREDENTIALS_KEY
+            )
+            if all_json:
+                try:
+                    all_creds = _json_loads(all_json)
+                    if not isinstance(all_creds, dict):
+                        raise ValueError("credentials map is not a JSON object")
+                except ValueError as e:
+                    all_creds = self._recover_corrupt_credentials(all_json, e)
+            else:
+                all_creds = self._migrate_legacy_credentials()
+
+            self._all_creds = all_creds
+            return all_creds
+
+    def _with_pending(self, all_creds: Dict[str, dict]) -> Dict[str, dict]:
+        """Apply changes that have not been written yet to a credentials map."""
+        with self._pending_lock:
+            if not self._pending:
+                return all_creds
+            pending = dict(self._pending)
+
+        all_creds = dict(all_creds)
+        for user_email, creds_data in pending.items():
+            if creds_data is None:
+                all_creds.pop(user_email, None)
+            else:
+                all_creds[user_email] = creds_data
+        return all_creds
+
+    def _load_all_credentials(self) -> Dict[str, dict]:
+        """Read the credentials map from the keychain, including pending writes."""
+        # Apply pending changes before a flush can write and clear them
+        with self._flush_lock:
+            return self._with_pending(self._read_all_credentials())
+
+    def _save_all_credentials(self, all_creds: Dict[str, dict]) -> None:
+        """Write the credentials map to the keychain. Must hold _flush_lock."""
+        self._get_keyring().set_password(
+            self.SERVICE_NAME, self._ALL_CREDENTIALS_KEY, _json_dumps(all_creds)
+        )
+        self._all_creds = all_creds
+
+    def _recover_corrupt_credentials(
+        self, all_json: str, error: Exception
+    ) -> Dict[str, dict]:
+        """
+        Replace an undecodable credentials map so users can authenticate again.
+
+        The corrupt map is first copied to a backup item, so it is never lost;
+        if that fails, the error propagates and the map is left untouched. The
+        map is then rebuilt from any legacy per-user items, or left empty.
+        Must hold _flush_lock.
+        """
+        logger.error(
+            f"Error decoding credentials map from keychain: {error}; "
+            f"moving it to {self._CORRUPT_CREDENTIALS_KEY} and rebuilding"
+        )
+        self._get_keyring().set_password(
+            self.SERVICE_NAME, self._CORRUPT_CREDENTIALS_KEY, all_json
+        )
+        all_creds = self._migrate_legacy_credentials()
+        if not all_creds:
+            self._save_all_credentials(all_creds)
+        return all_creds
+
+    def _migrate_legacy_credentials(self) -> Dict[str, dict]:
+        """
+        Copy credentials stored one item per user into the single-item layout.
+
+        Legacy items are left in place, so older versions can still read them;
+        delete_credential removes a user's legacy item along with the entry.
+        Must hold _flush_lock.
+        """
+        keyring = self._get_keyring()
+        all_creds: Dict[str, dict] = {}
         try:
-            users_json = self._keyring.get_password(self.SERVICE_NAME, self._USERS_KEY)
-            if users_json:
-                return set(json.loads(users_json))
+            users_json = keyring.get_password(self.SERVICE_NAME, self._USERS_KEY)
+            users = _json_loads(users_json) if users_json else []
         except (json.JSONDecodeError, TypeError) as e:
-            logger.warning(f"Error reading users list from keychain: {e}")
-        return set()
+            logger.warning(f"Error reading legacy users list from keychain: {e}")
+            users = []
+
+        for user_email in users:
+            try:
+                creds_json = keyring.get_password(self.SERVICE_NAME, user_email)
+                if creds_json:
+                    all_creds[user_email] = _json_loads(creds_json)
+            except json.JSONDecodeError as e:
+                logger.warning(
+                    f"Skipping undecodable legacy credentials for {user_email}: {e}"
+                )
 
-    def _save_users_set(self, users: set) -> None:
-        """Save the set of registered users to keychain."""
-        try:
-            self._keyring.set_password(
-                self.SERVICE_NAME, self._USERS_KEY, json.dumps(sorted(users))
-            )
-        except Exception as e:
-            logger.error(f"Error saving users list to keychain: {e}")
+        if not all_creds:
+            return all_creds
+
+        self._save_all_credentials(all_creds)
+        logger.info(f"Migrated credentials for {len(all_creds)} users in keychain")
+        return all_creds
 
     def get_credential(self, user_email: str) -> Optional[Credentials]:
         """Get credentials from macOS Keychain."""
-        try:
-            creds_json = self._keyring.get_password(self.SERVICE_NAME, user_email)
-            if not creds_json:
-                logger.debug(f"No credentials found in keychain for {user_email}")
+        cached = self._get_cached(user_email)
+        if cached is not None:
+            return cached
+
+        with self._get_user_lock(user_email):
+            # Another thread may have loaded them while we waited
+            cached = self._get_cached(user_email)
+            if cached is not None:
+                return cached
+
+            try:
+                # Re-read on every cache miss to pick up tokens refreshed by
+                # other processes sharing the keychain.
+                creds_data = self._load_all_credentials().get(user_email)
+                if not creds_data:
+                    logger.debug("No credentials found in keychain for %s", user_email)
+                    return None
+
+                credentials = _credentials_from_dict(creds_data, user_email)
+
+                logger.debug("Loaded credentials for %s from keychain", user_email)
+                self._set_cached(user_email, credentials)
+                return credentials
+
+            except Exception as e:
+                logger.error(f"Error retrieving credentials for {user_email}: {e}")
                 return None
 
-            creds_data = json.loads(creds_json)
-
-            # Parse expiry if present
-            expiry = None
-            if creds_data.get("expiry"):
+    def get_credentials_bulk(self, user_emails: List[str]) -> Dict[str, Credentials]:
+        """Get credentials for several users with a single keychain read."""
+        results: Dict[str, Credentials] = {}
+        pending = []
+        get_cached = self._get_cached
+        for user_email in user_emails:
+            cached = get_cached(user_email)
+            if cached is not None:
+                results[user_email] = cached
+            else:
+                pending.append(user_email)
+
+        if not pending:
+            return results
+
+        with self._lock_users(pending):
+            try:
+                all_creds = self._load_all_credentials()
+            except Exception as e:
+                logger.error(f"Error retrieving credentials from keychain: {e}")
+                return results
+
+            get_data = all_creds.get
+            set_cached = self._set_cached
+            for user_email in pending:
+                creds_data = get_data(user_email)
+                if not creds_data:
+                    continue
                 try:
-                    expiry = datetime.fromisoformat(creds_data["expiry"])
-                    # Ensure timezone-naive datetime for Google auth library compatibility
-                    if expiry.tzinfo is not None:
-                        expiry = expiry.replace(tzinfo=None)
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Could not parse expiry time for {user_email}: {e}")
-
-            credentials = Credentials(
-                token=creds_data.get("token"),
-                refresh_token=creds_data.get("refresh_token"),
-                token_uri=creds_data.get("token_uri"),
-                client_id=creds_data.get("client_id"),
-                client_secret=creds_data.get("client_secret"),
-                scopes=creds_data.get("scopes"),
-                expiry=expiry,
-            )
-
-            logger.debug(f"Loaded credentials for {user_email} from keychain")
-            return credentials
+                    credentials = _credentials_from_dict(creds_data, user_email)
+                except Exception as e:
+                    # Skip the malformed entry rather than failing the whole lookup
+                    logger.error(f"Error retrieving credentials for {user_email}: {e}")
+                    continue
+                set_cached(user_email, credentials)
+                results[user_email] = credentials
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding credentials for {user_email}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error retrieving credentials for {user_email}: {e}")
-            return None
+        return results
 
     def store_credential(self, user_email: str, credentials: Credentials) -> bool:
-        """Store credentials to macOS Keychain."""
-        creds_data = {
-            "token": credentials.token,
-            "refresh_token": credentials.refresh_token,
-            "token_uri": credentials.token_uri,
-            "client_id": credentials.client_id,
-            "client_secret": credentials.client_secret,
-            "scopes": credentials.scopes,
-            "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
-        }
-
-        try:
-            self._keyring.set_password(
-                self.SERVICE_NAME, user_email, json.dumps(creds_data)
-            )
+        """
+        Store credentials to macOS Keychain.
 
-            # Update users list
-            users = self._get_users_set()
-            users.add(user_email)
-            self._save_users_set(users)
+        Changes that only refresh the access token are written in the
+        background; anything else is written before returning.
+        """
+        with self._get_user_lock(user_email):
+            creds_data = _credentials_to_dict(credentials)
+            with self._pending_lock:
+                if user_email in self._pending:
+                    current = self._pending[user_email]
+                elif self._all_creds is not None:
+                    current = self._all_creds.get(user_email)
+                else:
+                    current = None
+            if current == creds_data:
+                logger.debug("Credentials for %s unchanged, skipping write", user_email)
+                return True
 
-            logger.info(f"Stored credentials for {user_email} in keychain")
+            self._invalidate_cached(user_email)
+            # A new user's grant or a rotated refresh token cannot be
+            # recovered if lost, so only token refreshes are written behind
+            refresh_token = creds_data["refresh_token"]
+            write_now = current is None or current.get("refresh_token") != refresh_token
+            with self._pending_lock:
+                self._pending[user_email] = creds_data
+                self._start_writer()
+
+            if write_now and not self.flush():
+                # The change stays pending and the writer keeps retrying it
+                self._flush_requested.set()
+                logger.error(f"Error storing credentials for {user_email} in keychain")
+                return False
+            if not write_now:
+                self._flush_requested.set()
+                logger.debug("Queued credentials for %s for keychain write", user_email)
             return True
 
-        except Exception as e:
-            logger.error(f"Error storing credentials for {user_email}: {e}")
-            return False
-
     def delete_credential(self, user_email: str) -> bool:
         """Delete credentials from macOS Keychain."""
-        try:
-            self._keyring.delete_password(self.SERVICE_NAME, user_email)
-
-            # Update users list
-            users = self._get_users_set()
-            users.discard(user_email)
-            self._save_users_set(users)
+        with self._get_user_lock(user_email):
+            self._invalidate_cached(user_email)
+            try:
+                if user_email not in self._load_all_credentials():
+                    # Nothing stored, consider it a success
+                    logger.debug("No credentials to delete for %s", user_email)
+                    return True
+            except Exception as e:
+                logger.error(f"Error deleting credentials for {user_email}: {e}")
+                return False
+
+            # Deletions are written immediately rather than left to the writer
+            with self._pending_lock:
+                self._pending[user_email] = None
+            if not self.flush():
+                logger.error(f"Error deleting credentials for {user_email}")
+                return False
+
+            # Migration keeps legacy per-user items, so remove any left behind
+            try:
+                self._get_keyring().delete_password(self.SERVICE_NAME, user_email)
+            except Exception as e:
+                logger.debug(
+                    "No legacy keychain item removed for %s: %s", user_email, e
+                )
 
             logger.info(f"Deleted credentials for {user_email} from keychain")
             return True
 
-        except self._keyring.errors.PasswordDeleteError:
-            # Password doesn't exist, consider it a success
-            logger.debug(f"No credentials to delete for {user_email}")
-            return True
-        except Exception as e:
-            logger.error(f"Error deleting credentials for {user_email}: {e}")
-            return False
+    def flush(self) -> bool:
+        """
+        Write any pending credential changes to the keychain.
+
+        Returns:
+            True if the changes were written or nothing was pending, False otherwise
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                pending = dict(self._pending)
+            if not pending:
+                return True
+
+            try:
+                # Read-modify-write against the current keychain contents so
+                # entries written by other processes are not lost.
+                all_creds = dict(self._read_all_credentials())
+                for user_email, creds_data in pending.items():
+                    if creds_data is None:
+                        all_creds.pop(user_email, None)
+                    else:
+                        all_creds[user_email] = creds_data
+                self._save_all_credentials(all_creds)
+            except Exception as e:
+                # Changes stay pending and are retried on the next flush
+                logger.error(f"Error writing credentials to keychain: {e}")
+                return False
+
+            with self._pending_lock:
+                for user_email, creds_data in pending.items():
+                    if (
+                        user_email in self._pending
+                        and self._pending[user_email] is creds_data
+                    ):
+                        del self._pending[user_email]
+
+        for user_email, creds_data in pending.items():
+            if creds_data is not None:
+                logger.info(f"Stored credentials for {user_email} in keychain")
+        return True
+
+    def _start_writer(self) -> None:
+        """Start the background writer thread. Must hold _pending_lock."""
+        if self._writer_thread is not None:
+            return
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="keychain-credential-writer", daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.flush)
+
+    def _writer_loop(self) -> None:
+        """Flush pending changes whenever a write is requested."""
+        retry_delay = _WRITE_RETRY_INITIAL_DELAY_SECONDS
+        while True:
+            self._flush_requested.wait()
+            # Give bursts of writes a moment to coalesce into one update
+            time.sleep(_WRITE_BEHIND_DELAY_SECONDS)
+            self._flush_requested.clear()
+            if self.flush():
+                retry_delay = _WRITE_RETRY_INITIAL_DELAY_SECONDS
+                continue
+
+            # Changes are still pending, so back off and try again
+            time.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, _WRITE_RETRY_MAX_DELAY_SECONDS)
+            self._flush_requested.set()
 
     def list_users(self) -> List[str]:
         """List all users with stored credentials."""
-        users = self._get_users_set()
-        logger.debug(f"Found {len(users)} users with credentials in keychain")
-        return sorted(users)
+        try:
+            # Re-read to pick up users added or removed by other processes
+            users = self._load_all_credentials()
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Error reading users list from keychain: {e}")
+            return []
+        logger.debug("Found %d users with credentials in keychain", len(users))
+        return list(users)
 
 
 # Global credential store instance
 _credential_store: Optional[CredentialStore] = None
 
+# Evaluated once at import rather than on every store lookup
+_IS_DARWIN = platform.system() == "Darwin"
+
 
 def get_credential_store() -> CredentialStore:
     """
@@ -376,7 +1045,7 @@ def get_credential_store() -> CredentialStore:
     global _credential_store
 
     if _credential_store is None:
-        if platform.system() != "Darwin":
+        if not _IS_DARWIN:
             raise RuntimeError(
                 "This MCP server only supports macOS. "
                 "Credential storage requires macOS Keychain."
@@ -83,7 +83,7 @@ def _find_any_credentials(
     """
     try:
         store = get_credential_store()
-        users = store.list_users()
+        users = store.list_users_sorted()
         if not users:
             logger.info(
                 "[single-user] No users found with credentials via credential store"